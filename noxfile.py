@@ -1,3 +1,7 @@
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from enum import Enum
 
 import nox
@@ -23,6 +27,36 @@ PYARROW = [
 NUMPY = ["1.24.4", "1.26.4", "2.0.2", "2.1.3"]
 
 
+def _v(version: str) -> tuple:
+    """
+    Parse a version string into an int tuple for comparisons.
+
+    Lexicographic string comparison happens to work for the pins above,
+    but breaks in general (eg "3.8" < "3.13" is False as strings).
+    """
+    return tuple(int(part) for part in version.split("."))
+
+
+def _python_version(session) -> str:
+    """
+    Report the major.minor version of the environment's python.
+
+    Asks the interpreter for sys.version_info directly, rather than
+    parsing the output of `python --version` (lstrip("Python ") strips
+    any of those characters, not the prefix).
+    """
+    value = session.run(
+        "uv",
+        "run",
+        "--no-sync",
+        "python",
+        "-c",
+        "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}')",
+        silent=True,
+    )
+    return value.strip()
+
+
 @nox.session(python=False)
 def test_pydantic_versions(session) -> None:
     """
@@ -36,9 +70,7 @@ def test_pydantic_versions(session) -> None:
     checks that this is handled correctly.
     """
     session.run("uv", "sync")
-    value = session.run("uv", "run", "--no-sync", "python", "--version", silent=True)
-    version_list = value.lstrip("Python ").split(".")[0:2]
-    version = ".".join(version_list)
+    version = _python_version(session)
     print(f"Python version: {version}")
 
     results = {}
@@ -47,12 +79,12 @@ def test_pydantic_versions(session) -> None:
         deps = {"pydantic": pydantic}
 
         result = Result.SKIPPED
-        if version < "3.13":
+        if _v(version) < (3, 13):
             result = run_tests(session, deps)
 
         if version == "3.13":
             # pydantic 2.8 is the first version to work with python 3.13
-            if pydantic >= "2.8.0":
+            if _v(pydantic) >= (2, 8, 0):
                 result = run_tests(session, deps)
 
         results[name] = result
@@ -62,60 +94,138 @@ def test_pydantic_versions(session) -> None:
         raise Exception("Test failed")
 
 
+def _pyarrow_cell_eligible(version: str, pyarrow: str, numpy: str) -> bool:
+    pa_v = _v(pyarrow)
+    np_v = _v(numpy)
+
+    if version == "3.8":
+        # All dependency constraints correctly expressed by pyarrow and numpy
+        # ie numpy < 1.25 and pyarrow < 18
+        return pa_v < (18, 0, 0) and numpy == "1.24.4"
+
+    if version == "3.9":
+        # Pyarrow < 15 does not correctly specify numpy < 2 constraint
+        # Pyarrow 15 only runs with numpy 1.x
+        # Pyarrow 16 and above can run with numpy 1.x or 2.x
+        # Python 3.9 has numpy < 2.1
+        return (pa_v < (16, 0, 0) and np_v < (2, 0)) or (
+            pa_v >= (16, 0, 0) and np_v < (2, 1)
+        )
+
+    if version in ["3.10", "3.11"]:
+        # Pyarrow < 15 does not correctly specify numpy < 2 constraint
+        # pyarrow 15 only runs with numpy 1.x
+        return (pa_v < (16, 0, 0) and np_v < (2, 0)) or pa_v >= (16, 0, 0)
+
+    if version == "3.12":
+        # Pyarrow < 15 does not correctly specify numpy < 2 constraint
+        # pyarrow 15 only runs with numpy 1.x
+        # No binary builds for pyarrow < 14 for python 3.12
+        # numpy 1.24.4 won't install on python 3.12+
+        return not (pa_v < (16, 0, 0) and np_v >= (2, 0)) and (
+            pa_v > (14, 0) and np_v >= (1, 25)
+        )
+
+    if version == "3.13":
+        # No binary builds for pyarrow < 18 for python 3.13
+        # numpy 1.24.4 won't install on python 3.12+
+        return pa_v >= (18, 0) and np_v >= (1, 25)
+
+    return False
+
+
+PYTHON_VERSIONS = ["3.8", "3.9", "3.10", "3.11", "3.12", "3.13"]
+
+# The compatibility rules evaluated once into a declarative table, so
+# scheduling only ever sees the runnable cells (and the table can be
+# exported for CI matrix fan-out).
+ELIGIBLE_CELLS = {
+    python_version: {
+        (pyarrow, numpy)
+        for pyarrow in PYARROW
+        for numpy in NUMPY
+        if _pyarrow_cell_eligible(python_version, pyarrow, numpy)
+    }
+    for python_version in PYTHON_VERSIONS
+}
+
+
+def _compile_cell_requirements(deps: dict, work_dir: str, env: dict) -> str:
+    """
+    Pre-resolve the project deps with the cell's pins into a frozen
+    requirements file, so the cell install is a plain sync. The file
+    lives in the per-run work dir: a persistent cache keyed only on the
+    pins would go stale as soon as pyproject.toml's dependencies change,
+    and fixed /tmp names are shared between users on a multi-user runner.
+    """
+    key = "-".join(f"{name}{pin}" for name, pin in sorted(deps.items()))
+    req_path = os.path.join(work_dir, f"req-{key}.txt")
+    override_path = os.path.join(work_dir, f"override-{key}.txt")
+    with open(override_path, "w") as fh:
+        fh.writelines(f"{name}=={pin}\n" for name, pin in deps.items())
+    cmd = [
+        *["uv", "pip", "compile", "--quiet", "--group", "test"],
+        *["--override", override_path, "pyproject.toml", "-o", req_path],
+    ]
+    subprocess.run(cmd, check=True, capture_output=True, env=env)  # noqa: S603
+    return req_path
+
+
+def _run_cell(index: int, deps: dict, work_dir: str) -> "tuple[Result, str]":
+    """
+    Run the test suite against pinned deps in an isolated environment.
+
+    Each cell gets its own UV_PROJECT_ENVIRONMENT so parallel workers
+    don't clobber a shared .venv. Runs via subprocess rather than
+    session.run, as nox sessions can't be shipped to worker processes.
+    Output is captured so workers don't interleave; on failure it is
+    returned with the result so the cell stays diagnosable.
+    """
+    venv_dir = os.path.join(work_dir, f"cell-{index}")
+    env = dict(os.environ, UV_PROJECT_ENVIRONMENT=venv_dir, VIRTUAL_ENV=venv_dir)
+    try:
+        req_path = _compile_cell_requirements(deps, work_dir, env)
+        for cmd in [
+            ["uv", "venv", venv_dir],
+            ["uv", "pip", "sync", req_path],
+            ["uv", "pip", "install", "--no-deps", "."],
+            ["uv", "run", "--no-sync", "python", "-m", "pytest"],
+        ]:
+            subprocess.run(cmd, check=True, capture_output=True, env=env)  # noqa: S603
+        return Result.SUCCESS, ""
+    except subprocess.CalledProcessError as err:
+        stdout = err.stdout.decode(errors="replace") if err.stdout else ""
+        stderr = err.stderr.decode(errors="replace") if err.stderr else ""
+        return Result.FAILURE, f"$ {' '.join(err.cmd)}\n{stdout}{stderr}"
+
+
 @nox.session(python=False)
 def test_pyarrow_versions(session) -> None:
     session.run("uv", "sync")
-    value = session.run("uv", "run", "--no-sync", "python", "--version", silent=True)
-    version_list = value.lstrip("Python ").split(".")[0:2]
-    version = ".".join(version_list)
+    version = _python_version(session)
     print(f"Python version: {version}")
 
-    results = {}
-    for pyarrow in PYARROW:
-        for numpy in NUMPY:
-            name = f"pyarrow=={pyarrow} & numpy=={numpy}"
-            deps = {"pyarrow": pyarrow, "numpy": numpy}
-
-            result = Result.SKIPPED
-            if version == "3.8":
-                # All dependency constraints correctly expressed by pyarrow and numpy
-                # ie numpy < 1.25 and pyarrow < 18
-                if pyarrow < "18.0.0" and numpy == "1.24.4":
-                    result = run_tests(session, deps)
-
-            if version == "3.9":
-                # Pyarrow < 15 does not correctly specify numpy < 2 constraint
-                # Pyarrow 15 only runs with numpy 1.x
-                # Pyarrow 16 and above can run with numpy 1.x or 2.x
-                # Python 3.9 has numpy < 2.1
-                if (pyarrow < "16.0.0" and numpy < "2.0") or (
-                    pyarrow >= "16.0.0" and numpy < "2.1"
-                ):
-                    result = run_tests(session, deps)
-
-            if version in ["3.10", "3.11"]:
-                # Pyarrow < 15 does not correctly specify numpy < 2 constraint
-                # pyarrow 15 only runs with numpy 1.x
-                if (pyarrow < "16.0.0" and numpy < "2.0") or pyarrow >= "16.0.0":
-                    result = run_tests(session, deps)
-
-            if version == "3.12":
-                # Pyarrow < 15 does not correctly specify numpy < 2 constraint
-                # pyarrow 15 only runs with numpy 1.x
-                # No binary builds for pyarrow < 14 for python 3.12
-                # numpy 1.24.4 won't install on python 3.12+
-                if not (pyarrow < "16.0.0" and numpy >= "2.0") and (
-                    pyarrow > "14.0" and numpy >= "1.25"
-                ):
-                    result = run_tests(session, deps)
-
-            if version == "3.13":
-                # No binary builds for pyarrow < 18 for python 3.13
-                # numpy 1.24.4 won't install on python 3.12+
-                if pyarrow >= "18.0" and numpy >= "1.25":
-                    result = run_tests(session, deps)
-
+    cells = [
+        (f"pyarrow=={pyarrow} & numpy=={numpy}", {"pyarrow": pyarrow, "numpy": numpy})
+        for pyarrow in PYARROW
+        for numpy in NUMPY
+    ]
+    results = {name: Result.SKIPPED for name, _ in cells}
+
+    eligible = ELIGIBLE_CELLS.get(version, set())
+    work_dir = tempfile.mkdtemp(prefix="nox-pyarrow-")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = {
+            pool.submit(_run_cell, index, deps, work_dir): name
+            for index, (name, deps) in enumerate(cells)
+            if (deps["pyarrow"], deps["numpy"]) in eligible
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            result, output = future.result()
             results[name] = result
+            if result == Result.FAILURE:
+                print(f"\033[31m{name} failed:\033[0m\n{output}")
 
     print_results(results)
     if any(result == Result.FAILURE for result in results.values()):
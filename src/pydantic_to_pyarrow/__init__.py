@@ -1,9 +1,10 @@
-from .schema import SchemaCreationError, get_pyarrow_schema
+from .schema import SchemaCreationError, clear_schema_cache, get_pyarrow_schema
 
 __version__ = "0.1.5"
 
 __all__ = [
     "__version__",
+    "clear_schema_cache",
     "get_pyarrow_schema",
     "SchemaCreationError",
 ]
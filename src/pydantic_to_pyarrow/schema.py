@@ -1,8 +1,23 @@
 import datetime
+import functools
 import types
 from decimal import Decimal
 from enum import EnumMeta
-from typing import Any, List, Literal, NamedTuple, Optional, Type, TypeVar, Union, cast
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import pyarrow as pa  # type: ignore
 from annotated_types import Ge, Gt
@@ -12,6 +27,13 @@ from typing_extensions import Annotated, get_args, get_origin
 BaseModelType = TypeVar("BaseModelType", bound=BaseModel)
 EnumType = TypeVar("EnumType", bound=EnumMeta)
 
+_NONE_TYPE = type(None)
+
+# Origins that represent a union: typing.Union on python 3.9, plus
+# types.UnionType (X | Y syntax) on python 3.10+ (the getattr default
+# collapses to just Union on older pythons).
+_UNION_ORIGINS = frozenset({Union, getattr(types, "UnionType", Union)})
+
 
 class SchemaCreationError(Exception):
     """Error when creating pyarrow schema."""
@@ -23,60 +45,113 @@ class Settings(NamedTuple):
     exclude_fields: bool
 
 
-FIELD_MAP = {
-    str: pa.string(),
-    bytes: pa.binary(),
-    bool: pa.bool_(),
-    float: pa.float64(),
-    datetime.date: pa.date32(),
-    NaiveDatetime: pa.timestamp("ms", tz=None),
-    datetime.time: pa.time64("us"),
-}
+# Single tuple so non-bound metadata is rejected with one isinstance call
+_INT_BOUND_METADATA = (Gt, Ge)
+
+# pa.DataType objects are immutable and value-equal, so identical shapes
+# can share one instance rather than calling the pa constructors per field.
+_STR_DICT_TYPE = pa.dictionary(pa.int32(), pa.string())
+_INT64_TYPE = pa.int64()
+_UINT64_TYPE = pa.uint64()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_decimal_type(max_digits: int, decimal_places: int) -> pa.DataType:
+    return pa.decimal128(max_digits, decimal_places)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_list_type(value_type: pa.DataType) -> pa.DataType:
+    return pa.list_(value_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_map_type(key_type: pa.DataType, item_type: pa.DataType) -> pa.DataType:
+    return pa.map_(key_type, item_type)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_field(name: str, pa_type: pa.DataType, nullable: bool) -> pa.Field:
+    return pa.field(name, pa_type, nullable=nullable)
+
+
+FIELD_MAP = types.MappingProxyType(
+    {
+        str: pa.string(),
+        bytes: pa.binary(),
+        bool: pa.bool_(),
+        float: pa.float64(),
+        datetime.date: pa.date32(),
+        NaiveDatetime: pa.timestamp("ms", tz=None),
+        datetime.time: pa.time64("us"),
+    }
+)
 
 # Timezone aware datetimes will lose their timezone information
 # (but be correctly converted to UTC) when converted to pyarrow.
 # Pyarrow does support having an entire column in a single timezone,
 # but these bare types cannot guarantee that.
-LOSING_TZ_TYPES = {
-    datetime.datetime: pa.timestamp("ms", tz=None),
-    AwareDatetime: pa.timestamp("ms", tz=None),
-}
+LOSING_TZ_TYPES = types.MappingProxyType(
+    {
+        datetime.datetime: pa.timestamp("ms", tz=None),
+        AwareDatetime: pa.timestamp("ms", tz=None),
+    }
+)
 
 
-def _get_int_type(metadata: List[Any]) -> pa.DataType:
+def _get_int_type(
+    _field_type: Type[Any],
+    metadata: List[Any],
+    _settings: Settings,
+) -> pa.DataType:
     min_value: Optional[int] = None
     for el in metadata:
+        if not isinstance(el, _INT_BOUND_METADATA):
+            continue
         if isinstance(el, Gt):
             if el.gt is not None and not isinstance(el.gt, int):
                 raise SchemaCreationError("Gt metadata must be int")
             min_value = el.gt
-        elif isinstance(el, Ge):
+        else:
             if el.ge is not None and not isinstance(el.ge, int):
                 raise SchemaCreationError("Ge metadata must be int")
             min_value = el.ge
+        break
 
     if min_value is not None and min_value >= 0:
-        return pa.uint64()
-    return pa.int64()
+        return _UINT64_TYPE
+    return _INT64_TYPE
 
 
-def _get_decimal_type(metadata: List[Any]) -> pa.DataType:
-    general_metadata = None
-    for el in metadata:
-        if hasattr(el, "max_digits") and hasattr(el, "decimal_places"):
-            general_metadata = el
+def _get_decimal_type(
+    _field_type: Type[Any],
+    metadata: List[Any],
+    _settings: Settings,
+) -> pa.DataType:
+    general_metadata = next(
+        (
+            el
+            for el in metadata
+            if hasattr(el, "max_digits") and hasattr(el, "decimal_places")
+        ),
+        None,
+    )
     if general_metadata is None:
         raise SchemaCreationError(
             "Decimal type needs annotation setting max_digits and decimal_places"
         )
 
-    return pa.decimal128(general_metadata.max_digits, general_metadata.decimal_places)
+    return _cached_decimal_type(
+        general_metadata.max_digits, general_metadata.decimal_places
+    )
 
 
-TYPES_WITH_METADATA = {
-    Decimal: _get_decimal_type,
-    int: _get_int_type,
-}
+TYPES_WITH_METADATA = types.MappingProxyType(
+    {
+        Decimal: _get_decimal_type,
+        int: _get_int_type,
+    }
+)
 
 
 def _get_literal_type(
@@ -84,13 +159,15 @@ def _get_literal_type(
     _metadata: List[Any],
     _settings: Settings,
 ) -> pa.DataType:
-    values = get_args(field_type)
-    if all(isinstance(value, str) for value in values):
-        return pa.dictionary(pa.int32(), pa.string())
-    elif all(isinstance(value, int) for value in values):
+    # One pass over the values: collect the distinct value types, then
+    # check those rather than re-scanning the values per candidate type.
+    kinds = {type(value) for value in get_args(field_type)}
+    if all(issubclass(kind, str) for kind in kinds):
+        return _STR_DICT_TYPE
+    elif all(issubclass(kind, int) for kind in kinds):
         # Dictionary of (int, int) is converted to just int when
         # written into parquet.
-        return pa.int64()
+        return _INT64_TYPE
     else:
         msg = "Literal type is only supported with all int or string values. "
         raise SchemaCreationError(msg)
@@ -101,11 +178,10 @@ def _get_list_type(
     metadata: List[Any],
     settings: Settings,
 ) -> pa.DataType:
-    sub_type = get_args(field_type)[0]
-    if _is_optional(sub_type):
-        # pyarrow lists can have null elements in them
-        sub_type = list(set(get_args(sub_type)) - {type(None)})[0]
-    return pa.list_(_get_pyarrow_type(sub_type, metadata, settings))
+    # pyarrow lists can have null elements in them, so Optional
+    # elements are simply unwrapped
+    sub_type, _ = _strip_optional(get_args(field_type)[0])
+    return _cached_list_type(_get_pyarrow_type(sub_type, metadata, settings))
 
 
 def _get_annotated_type(
@@ -114,13 +190,11 @@ def _get_annotated_type(
     settings: Settings,
 ) -> pa.DataType:
     # TODO: fix / clean up / understand why / if this works in all cases
-    args = get_args(field_type)[1:]
-    metadatas = [
-        item.metadata if hasattr(item, "metadata") else [item] for item in args
-    ]
-    metadata = [item for sublist in metadatas for item in sublist]
-    field_type = cast(Type[Any], get_args(field_type)[0])
-    return _get_pyarrow_type(field_type, metadata, settings)
+    args = get_args(field_type)
+    metadata = list(
+        chain.from_iterable(getattr(item, "metadata", (item,)) for item in args[1:])
+    )
+    return _get_pyarrow_type(cast(Type[Any], args[0]), metadata, settings)
 
 
 def _get_dict_type(
@@ -129,117 +203,157 @@ def _get_dict_type(
     settings: Settings,
 ) -> pa.DataType:
     key_type, value_type = get_args(field_type)
-    return pa.map_(
+    return _cached_map_type(
         _get_pyarrow_type(key_type, metadata, settings),
         _get_pyarrow_type(value_type, metadata, settings),
     )
 
 
-FIELD_TYPES = {
-    Literal: _get_literal_type,
-    list: _get_list_type,
-    Annotated: _get_annotated_type,
-    dict: _get_dict_type,
+FIELD_TYPES = types.MappingProxyType(
+    {
+        Literal: _get_literal_type,
+        list: _get_list_type,
+        Annotated: _get_annotated_type,
+        dict: _get_dict_type,
+    }
+)
+
+_TypeHandler = Callable[[Type[Any], List[Any], Settings], pa.DataType]
+
+
+def _fixed_type_handler(pa_type: pa.DataType) -> _TypeHandler:
+    def handler(
+        _field_type: Type[Any],
+        _metadata: List[Any],
+        _settings: Settings,
+    ) -> pa.DataType:
+        return pa_type
+
+    return handler
+
+
+def _losing_tz_handler(
+    field_type: Type[Any],
+    _metadata: List[Any],
+    settings: Settings,
+) -> pa.DataType:
+    if not settings.allow_losing_tz:
+        raise SchemaCreationError(
+            f"{field_type} only allowed if ok losing timezone information"
+        )
+    return LOSING_TZ_TYPES[field_type]
+
+
+# A single dispatch table fusing the tables above, so that
+# _get_pyarrow_type does one hash lookup (plus one on the origin for
+# generics) rather than probing each table in turn.
+_DISPATCH: Dict[Any, _TypeHandler] = {
+    **{ft: _fixed_type_handler(pa_type) for ft, pa_type in FIELD_MAP.items()},
+    **dict.fromkeys(LOSING_TZ_TYPES, _losing_tz_handler),
+    **TYPES_WITH_METADATA,
+    **FIELD_TYPES,
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _is_enum_type(field_type: Type[Any]) -> bool:
+    return isinstance(field_type, EnumMeta)
+
+
+@functools.lru_cache(maxsize=None)
+def _is_base_model_type(field_type: Type[Any]) -> bool:
+    # isinstance(filed_type, type) checks whether it's a class
+    # otherwise eg Deque[int] would casue an exception on issubclass
+    return isinstance(field_type, type) and issubclass(field_type, BaseModel)
+
+
 def _get_enum_type(field_type: Type[Any]) -> pa.DataType:
-    is_str = [isinstance(enum_value.value, str) for enum_value in field_type]
-    if all(is_str):
-        return pa.dictionary(pa.int32(), pa.string())
+    kinds = {type(enum_value.value) for enum_value in field_type}
+    if all(issubclass(kind, str) for kind in kinds):
+        return _STR_DICT_TYPE
 
-    is_int = [isinstance(enum_value.value, int) for enum_value in field_type]
-    if all(is_int):
-        return pa.int64()
+    if all(issubclass(kind, int) for kind in kinds):
+        return _INT64_TYPE
 
     msg = "Enums only allowed if all str or all int"
     raise SchemaCreationError(msg)
 
 
-def _is_optional(field_type: Type[Any]) -> bool:
-    origin = get_origin(field_type)
-    is_python_39_union = origin is Union
-    is_python_310_union = hasattr(types, "UnionType") and origin is types.UnionType
-
-    if not is_python_39_union and not is_python_310_union:
-        return False
+@functools.lru_cache(maxsize=1024)
+def _strip_optional(field_type: Type[Any]) -> Tuple[Type[Any], bool]:
+    """Unwrap Optional[X] to (X, True), leaving other types as (X, False)."""
+    if get_origin(field_type) not in _UNION_ORIGINS:
+        return field_type, False
 
-    return type(None) in get_args(field_type)
+    args = get_args(field_type)
+    if _NONE_TYPE not in args:
+        return field_type, False
+    # mypy infers the args as Type[Any] | None here, hence casting
+    return cast(Type[Any], next(arg for arg in args if arg is not _NONE_TYPE)), True
 
 
+# field_type is Any rather than Type[Any]: mypy rejects Type[Any] against
+# the Hashable bound on the lru_cache'd helpers this feeds.
 def _get_pyarrow_type(
-    field_type: Type[Any],
+    field_type: Any,  # noqa: ANN401 - see above
     metadata: List[Any],
     settings: Settings,
 ) -> pa.DataType:
-    if field_type in FIELD_MAP:
-        return FIELD_MAP[field_type]
-
-    if settings.allow_losing_tz and field_type in LOSING_TZ_TYPES:
-        return LOSING_TZ_TYPES[field_type]
-
-    if not settings.allow_losing_tz and field_type in LOSING_TZ_TYPES:
-        raise SchemaCreationError(
-            f"{field_type} only allowed if ok losing timezone information"
-        )
-
-    if isinstance(field_type, EnumMeta):
+    handler = _DISPATCH.get(field_type)
+    if handler is None:
+        handler = _DISPATCH.get(get_origin(field_type))
+    if handler is not None:
+        return handler(field_type, metadata, settings)
+
+    # The metaclass / MRO checks are cached so repeated schema builds
+    # skip the isinstance/issubclass walk for types already seen.
+    if _is_enum_type(field_type):
         return _get_enum_type(field_type)
 
-    if field_type in TYPES_WITH_METADATA:
-        return TYPES_WITH_METADATA[field_type](metadata)
-
-    if get_origin(field_type) in FIELD_TYPES:
-        return FIELD_TYPES[get_origin(field_type)](
-            field_type,
-            metadata,
-            settings,
-        )
-
-    # isinstance(filed_type, type) checks whether it's a class
-    # otherwise eg Deque[int] would casue an exception on issubclass
-    if isinstance(field_type, type) and issubclass(field_type, BaseModel):
+    if _is_base_model_type(field_type):
         return _get_pyarrow_schema(field_type, settings, as_schema=False)
 
     raise SchemaCreationError(f"Unknown type: {field_type}")
 
 
+# pa.Schema and pa.StructType objects are immutable, so repeated
+# conversions of the same model can safely share one result. If a model
+# is changed in place (eg model_rebuild), the cache can be reset with
+# _get_pyarrow_schema.cache_clear().
+@functools.lru_cache(maxsize=None)
 def _get_pyarrow_schema(
-    pydantic_class: Type[BaseModelType],
+    pydantic_class: Any,  # noqa: ANN401 - Type[Any] fails lru_cache's Hashable bound
     settings: Settings,
     as_schema: bool = True,
 ) -> pa.Schema:
     fields = []
-    for name, field_info in pydantic_class.model_fields.items():
-        if field_info.exclude and settings.exclude_fields:
-            continue
-        field_type = field_info.annotation
-        metadata = field_info.metadata
-
-        if field_type is None:
-            # Not sure how to get here through pydantic, hence nocover
-            raise SchemaCreationError(
-                f"Missing type for field {name}"
-            )  # pragma: no cover
-
-        try:
-            nullable = False
-            if _is_optional(field_type):
-                nullable = True
-                types_under_union = list(set(get_args(field_type)) - {type(None)})
-                # mypy infers field_type as Type[Any] | None here, hence casting
-                field_type = cast(Type[Any], types_under_union[0])
-
+    name = field_type = None
+    # A single handler around the whole loop, rather than one per field:
+    # on a failure the loop locals still identify the offending field.
+    try:
+        for name, field_info in pydantic_class.model_fields.items():
+            if field_info.exclude and settings.exclude_fields:
+                continue
+            field_type = field_info.annotation
+            metadata = field_info.metadata
+
+            if field_type is None:
+                # Not sure how to get here through pydantic, hence nocover
+                raise SchemaCreationError(
+                    f"Missing type for field {name}"
+                )  # pragma: no cover
+
+            field_type, nullable = _strip_optional(field_type)
             pa_field = _get_pyarrow_type(field_type, metadata, settings)
-        except Exception as err:  # noqa: BLE001 - ignore blind exception
-            raise SchemaCreationError(
-                f"Error processing field {name}: {field_type}, {err}"
-            ) from err
 
-        serialized_name = name
-        if settings.by_alias and field_info.serialization_alias is not None:
-            serialized_name = field_info.serialization_alias
-        fields.append(pa.field(serialized_name, pa_field, nullable=nullable))
+            serialized_name = name
+            if settings.by_alias and field_info.serialization_alias is not None:
+                serialized_name = field_info.serialization_alias
+            fields.append(_cached_field(serialized_name, pa_field, nullable))
+    except Exception as err:  # noqa: BLE001 - ignore blind exception
+        raise SchemaCreationError(
+            f"Error processing field {name}: {field_type}, {err}"
+        ) from err
 
     if as_schema:
         return pa.schema(fields)
@@ -273,3 +387,13 @@ def get_pyarrow_schema(
         exclude_fields=exclude_fields,
     )
     return _get_pyarrow_schema(pydantic_class, settings)
+
+
+def clear_schema_cache() -> None:
+    """
+    Clears the cached schemas.
+
+    Schemas are cached per (pydantic class, settings), so this is only
+    needed if a model class is changed in place, eg via model_rebuild().
+    """
+    _get_pyarrow_schema.cache_clear()
@@ -0,0 +1,7 @@
+import pyarrow as pa  # type: ignore
+
+# The test tables are one or two rows, so pyarrow's default thread pool
+# (one thread per core) only adds startup and coordination overhead.
+# Pin the compute and I/O pools to a single thread for the whole run.
+pa.set_cpu_count(1)
+pa.set_io_thread_count(1)
@@ -1,9 +1,7 @@
 import datetime
-import tempfile
 from decimal import Decimal
 from enum import Enum, auto
-from pathlib import Path
-from typing import Any, Deque, Dict, List, Literal, Optional, Tuple
+from typing import Any, Deque, Dict, List, Literal, Optional, Tuple, Type, Union
 
 import pyarrow as pa  # type: ignore
 import pyarrow.parquet as pq  # type: ignore
@@ -25,7 +23,15 @@ from pydantic.types import (
 )
 from typing_extensions import Annotated
 
-from pydantic_to_pyarrow import SchemaCreationError, get_pyarrow_schema
+from pydantic_to_pyarrow import (
+    SchemaCreationError,
+    clear_schema_cache,
+    get_pyarrow_schema,
+)
+
+# Parsed once for the whole module - the installed versions can't
+# change mid-run, and version.parse does regex work per call.
+PYDANTIC_VERSION = version.parse(pydantic.__version__)
 
 
 def _write_pq_and_read(
@@ -38,52 +44,47 @@ def _write_pq_and_read(
 
     In this way, it can be checked whether the data conversion has
     affected either the schema or the data.
+
+    The parquet bytes are kept in memory, as writing to disk doesn't
+    change the round-trip behavior under test.
     """
-    tbl = pa.Table.from_pylist(objs, schema=schema)
-    with tempfile.TemporaryDirectory() as temp_dir:
-        path = Path(temp_dir) / "values.parquet"
-        pq.write_table(tbl, path)
-        new_tbl = pq.read_table(path)
+    # A RecordBatch avoids the chunked-table indirection of
+    # pa.Table.from_pylist for these single-batch payloads.
+    batch = pa.RecordBatch.from_pylist(objs, schema=schema)
+    buf = pa.BufferOutputStream()
+    # Compression, dictionary encoding and statistics are storage
+    # details that don't affect the schema / data fidelity under test.
+    with pq.ParquetWriter(
+        buf, schema, compression="none", use_dictionary=False, write_statistics=False
+    ) as writer:
+        writer.write_batch(batch)
+    new_tbl = pq.read_table(pa.BufferReader(buf.getvalue()))
 
     new_objs = new_tbl.to_pylist()
     return new_tbl.schema, new_objs
 
 
-def test_simple_types() -> None:
-    class SimpleModel(BaseModel):
-        a: str
-        b: bool
-        c: int
-        d: float
-        e: bytes
-
-    expected = pa.schema(
-        [
-            pa.field("a", pa.string(), nullable=False),
-            pa.field("b", pa.bool_(), nullable=False),
-            pa.field("c", pa.int64(), nullable=False),
-            pa.field("d", pa.float64(), nullable=False),
-            pa.field("e", pa.binary(), nullable=False),
-        ]
+@pytest.mark.parametrize(
+    "field_types",
+    [
+        (str, bool, int, float, bytes),
+        (StrictStr, StrictBool, StrictInt, StrictFloat, StrictBytes),
+    ],
+)
+def test_simple_types(field_types: Tuple[Type[Any], ...]) -> None:
+    """
+    The plain and strict pydantic types should produce identical
+    schemas, so both run through the same test.
+    """
+    model = pydantic.create_model(
+        "SimpleModel",
+        a=(field_types[0], ...),
+        b=(field_types[1], ...),
+        c=(field_types[2], ...),
+        d=(field_types[3], ...),
+        e=(field_types[4], ...),
     )
 
-    actual = get_pyarrow_schema(SimpleModel)
-    assert actual == expected
-
-    objs = [{"a": "a", "b": True, "c": 1, "d": 1.01, "e": b"e"}]
-    new_schema, new_objs = _write_pq_and_read(objs, expected)
-    assert new_schema == expected
-    assert new_objs == objs
-
-
-def test_strict_simple_types() -> None:
-    class SimpleModel(BaseModel):
-        a: StrictStr
-        b: StrictBool
-        c: StrictInt
-        d: StrictFloat
-        e: StrictBytes
-
     expected = pa.schema(
         [
             pa.field("a", pa.string(), nullable=False),
@@ -94,7 +95,7 @@ def test_strict_simple_types() -> None:
         ]
     )
 
-    actual = get_pyarrow_schema(SimpleModel)
+    actual = get_pyarrow_schema(model)
     assert actual == expected
 
     objs = [{"a": "a", "b": True, "c": 1, "d": 1.01, "e": b"e"}]
@@ -112,6 +113,15 @@ def test_unknown_type() -> None:
     assert "Unknown type" in str(err)
 
 
+def test_union_without_none() -> None:
+    class UnionModel(BaseModel):
+        a: Union[int, str]
+
+    with pytest.raises(SchemaCreationError) as err:
+        get_pyarrow_schema(UnionModel)
+    assert "Unknown type" in str(err)
+
+
 def test_positive_ints() -> None:
     class IntModel(BaseModel):
         a: int
@@ -567,6 +577,20 @@ def test_exclude_fields_false() -> None:
     assert actual == expected
 
 
+def test_schema_is_cached() -> None:
+    class SimpleModel(BaseModel):
+        a: str
+
+    first = get_pyarrow_schema(SimpleModel)
+    second = get_pyarrow_schema(SimpleModel)
+    assert second is first
+
+    clear_schema_cache()
+    third = get_pyarrow_schema(SimpleModel)
+    assert third is not first
+    assert third == first
+
+
 def test_dict() -> None:
     class DictModel(BaseModel):
         foo: Dict[str, int]
@@ -664,8 +688,7 @@ def test_alias_generator() -> None:
         ]
     )
 
-    pydantic_version = version.parse(pydantic.__version__)
-    if pydantic_version < version.parse("2.5.0"):
+    if PYDANTIC_VERSION < version.parse("2.5.0"):
         # pydantic 2.5.0 fixed an issue / bug, that setting validation_alias
         # would then remove the alias_generator from the serialization_alias
         # This library follows the functionality in the installed version